@@ -12,8 +12,9 @@ try:
 except (ValueError, ModuleNotFoundError):
 	print("XApps not found, tray icon is not available.")
 from os import environ
+from threading import Thread
 # imports from my other files with classes and methods
-from easydict_gtk.html_generator import CreateHtml, db_search
+from easydict_gtk.html_generator import CreateHtml, db_search, load_word_index
 from easydict_gtk.handlers import Handlers
 from easydict_gtk.settings import cwd, cwd_images, Settings
 
@@ -58,6 +59,7 @@ class EasyDict(Handlers, Settings):
 		
 		# clipboard function
 		self.clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
+		self.clipboard_timeout = None # id of pending search after clipboard change
 		self.clipboard.connect("owner-change", self.onClipboard)
 		
 		# settings objects
@@ -71,6 +73,9 @@ class EasyDict(Handlers, Settings):
 		# initiate user settings
 		self.initiate_settings()
 		
+		# load the dictionary and its word index in background, so the first search does not wait for it
+		Thread(target=load_word_index, args=(self.language,), daemon=True).start()
+		
 		# settings of windows
 		self.window.set_icon_from_file(str(self.cwd_images / "ed_icon.png"))
 		self.window.set_keep_above(True)
@@ -1,9 +1,25 @@
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, Gdk
+gi.require_version("GdkPixbuf", "2.0")
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
+from easydict_gtk.settings import cwd_images
+
+# flags are rendered from files only once for every language and scale factor, not on every change of language
+flag_surfaces = {}
 
 class Handlers:
+	def set_flag(self, language):
+		"""Show the flag of the search language on the search button."""
+		scale = self.image_language.get_scale_factor()
+		if (language, scale) not in flag_surfaces:
+			flag_file = str(cwd_images / f"flag_{language}.svg")
+			_, width, height = GdkPixbuf.Pixbuf.get_file_info(flag_file)
+			# render SVG for the scale factor of the widget (HiDPI), like GTK does it with props.file
+			pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(flag_file, width * scale, height * scale, True)
+			flag_surfaces[(language, scale)] = Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, None)
+		self.image_language.set_from_surface(flag_surfaces[(language, scale)])
+	
 	def onXButton(self, *args):
 		"""This is used to hide main window, when the close button (X) is pressed"""
 		if self.tray != None:
@@ -14,16 +30,15 @@ class Handlers:
 	
 	def onSearchClicked(self, button):
 		if self.entry_search.props.text_length > 0: # user is not able to send empty query
-			self.results = self.db_search(self.language, self.entry_search.get_text(), self.button_fulltext.get_active())
-			self.html = self.create_html(self.results, self.language)
-			self.webview.load_html(self.html)
+			results = self.db_search(self.language, self.entry_search.get_text(), self.button_fulltext.get_active())
+			self.webview.load_html(self.create_html(results, self.language))
 	
 	def onLangClicked(self, button):
 		if button.props.text == "English":
 			self.language = 'eng'
 		if button.props.text == "Czech":
 			self.language = 'cze'
-		self.image_language.props.file = str(self.cwd_images / f"flag_{self.language}.svg")
+		self.set_flag(self.language)
 	
 	def onSearchRightClick(self, button, event):
 		# detects if the right mouse button is pressed https://lazka.github.io/pgi-docs/Gdk-3.0/classes/Event.html#Gdk.Event.get_button
@@ -50,13 +65,22 @@ class Handlers:
 						self.entry_search.set_text(self.clipboard.wait_for_text())
 	
 	def onClipboard(self, clippboard, event):
+		# clipboard often changes several times in a row, so the search runs only after 50 ms without next change
+		if self.clipboard_timeout != None:
+			GLib.source_remove(self.clipboard_timeout)
+		self.clipboard_timeout = GLib.timeout_add(50, self.onClipboardSettled)
+	
+	def onClipboardSettled(self):
+		self.clipboard_timeout = None
 		if self.window.props.visible: # first condition is check, if the window is shown
 			if self.checkbutton_scan.get_active(): # second condition is state of check button for clipboard scan, it can be from prefdb, but this is maybe better
-				if self.clipboard.wait_for_text() != None: # if clipboard was something else, result is None, else is text, which is converted to UTF-8
-					if len(self.clipboard.wait_for_text().split()) == 1: # this condition is check, if in clipboard is just one word
+				clipboard_text = self.clipboard.wait_for_text() # ask the clipboard owner only once
+				if clipboard_text != None: # if clipboard was something else, result is None, else is text, which is converted to UTF-8
+					if len(clipboard_text.split()) == 1: # this condition is check, if in clipboard is just one word
 						# three consecutive conditions look little bit ugly, but it make sense and it is better then logical and
-						self.entry_search.set_text(self.clipboard.wait_for_text()) # text from clipboard added to search entry
+						self.entry_search.set_text(clipboard_text) # text from clipboard added to search entry
 						self.onSearchClicked(None) # run search method which will show results in webview
+		return False # run the timeout only once
 	
 	def onNonEmptyText(self, *args):
 		if self.entry_search.get_text():
@@ -95,7 +119,7 @@ class Handlers:
 	def onComboboxLanguageChanged(self, combo):
 		self.write_setting("search_language", combo.get_active_id())
 		# those next two lines means, that settings of language has immediate effect on the current search (it may not be necessary or desirable)
-		self.image_language.props.file = str(self.cwd_images / f"flag_{combo.get_active_id()}.svg")
+		self.set_flag(combo.get_active_id())
 		self.language = combo.get_active_id()
 	
 	
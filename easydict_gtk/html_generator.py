@@ -1,17 +1,69 @@
 import difflib
+import heapq
 import re
+from functools import lru_cache
+from threading import Lock
 # imports from my other files with classes and methods
-from .settings import cwd, cwd_images, eng_cze, where
+from .settings import cwd, cwd_images, db, eng_cze, where
 
-def db_search(language, text, fulltext):
-    if fulltext == False: 
+@lru_cache(maxsize=256)
+def compile_pattern(text):
+    """Compile the search pattern once, not for every row of the table."""
+    return re.compile(text, re.IGNORECASE)
+
+# dictionary is parsed from file only once, even if preloading thread and search ask for it at the same time
+dictionary_lock = Lock()
+
+def load_dictionary():
+    """Return rows of eng_cze table, as they were parsed from JSON and cached by CachingMiddleware."""
+    with dictionary_lock:
+        return db.storage.read()[eng_cze.name]
+
+# word index for whole word search, it is built for every language on its first search (or preloaded by EasyDict)
+word_index = {}
+word_index_lock = Lock()
+
+def build_word_index(language):
+    """Map every lowercased word of the language column to rows, where the word is."""
+    index = {}
+    # rows are the dicts parsed from JSON and cached by CachingMiddleware, so index does not copy them
+    for row in load_dictionary().values():
+        for word in set(re.findall(r"\w+", row[language].lower())):
+            index.setdefault(word, []).append(row)
+    return index
+
+def word_index_usable(text):
+    """Index keys are lowercased words, but regex IGNORECASE matches also other letters for some of them (İ, ı, ſ, ß, µ...)."""
+    return re.fullmatch(r"\w+", text) and all(len(char.lower()) == 1 and char.upper().lower() == char.lower() for char in text)
+
+def load_word_index(language):
+    """Build word index of the language, if it is not built yet. It is safe to call it from another thread."""
+    with word_index_lock:
+        if language not in word_index:
+            word_index[language] = build_word_index(language)
+    return word_index[language]
+
+# last searches are remembered already limited, so repeated search costs nothing and keeps at most 16 x limit rows
+@lru_cache(maxsize=16)
+def db_search(language, text, fulltext, limit=200):
+    if fulltext == False and word_index_usable(text):
+        # one plain word is looked up in the word index instead of testing every row with regex
+        results = load_word_index(language).get(text.lower(), [])
         text = rf'\b{text}\b'
-    results = eng_cze.search(where(language).search(text, flags=re.IGNORECASE))
-    results_with_matchratio = []
-    for result in results:
-        ratio = difflib.SequenceMatcher(None, result[language], text).ratio()
-        results_with_matchratio.append([result, ratio])
-    return sorted(results_with_matchratio, key=lambda x: x[1], reverse=True)
+    else:
+        if fulltext == False:
+            text = rf'\b{text}\b'
+        pattern = compile_pattern(text)
+        # wait only for loading of the dictionary file (not for building of word index), so it is not read twice
+        load_dictionary()
+        results = eng_cze.search(where(language).test(pattern.search))
+    # one matcher for all rows, because SequenceMatcher caches informations about second sequence
+    matcher = difflib.SequenceMatcher(None, b=text)
+    def match_ratio(result):
+        matcher.set_seq1(result[language])
+        return matcher.ratio()
+    # user reads just the best results, so only they are sorted (same order as sorted(...)[:limit])
+    return heapq.nlargest(limit, results, key=match_ratio)
 
 class CreateHtml:
     def __init__(self):
@@ -33,8 +85,7 @@ class CreateHtml:
         <html>
         <body style="background-color:#2d2d2d;", oncontextmenu="return false">
         """        
-        for row in results:
-            html_string = html_string + self.create_html(row[0])
+        html_string = html_string + "".join(self.create_html(row) for row in results)
         html_string = html_string + """
         </body>
         </html>
@@ -23,22 +23,24 @@ query = Query()
 
 class Settings:
 	def initiate_settings(self):
+		# read all settings with one search (every search reads the whole settings file)
+		prefs = {pref["settings"]: pref["value"] for pref in prefdb.search(query["settings"].one_of(["clipboard_scan", "win_size_remember", "window_size", "search_language"]))}
 		try:
 			# get setting of clippboard scan from db and set it
-			pref_clipboard_scan = prefdb.search(query["settings"] == "clipboard_scan")[0]["value"]
+			pref_clipboard_scan = prefs["clipboard_scan"]
 			self.checkbutton_scan.props.active = pref_clipboard_scan
 			# get setting of window size remembering from db and set it
-			pref_win_size_remember = prefdb.search(query["settings"] == "win_size_remember")[0]["value"]
+			pref_win_size_remember = prefs["win_size_remember"]
 			self.checkbutton_size.props.active = pref_win_size_remember
 			# get the window size from db and set it
-			window_width, window_height = prefdb.search(query["settings"] == "window_size")[0]["value"]
+			window_width, window_height = prefs["window_size"]
 			self.window.set_default_size(window_width, window_height)			
 			# get setting of search language from db and set it
-			pref_search_language = prefdb.search(query["settings"] == "search_language")[0]["value"]
-			self.image_language.props.file = str(self.cwd_images / f"flag_{pref_search_language}.svg")
+			pref_search_language = prefs["search_language"]
+			self.set_flag(pref_search_language)
 			self.language = pref_search_language
 			self.combobox_language.set_active_id(pref_search_language)
-		except IndexError:
+		except KeyError:
 			self.create_default_settings()
 		# set the version from poetry pyproject.toml file
 		self.dialog_about.props.version = self.extract_version_from_toml()
@@ -58,14 +60,14 @@ class Settings:
 	def extract_version_from_toml(self):
 		"""Extract version from pyproject.toml file (poetry settings file)"""
 		toml_path = cwd.parent / 'pyproject.toml'
-		result = None
-		if toml_path.is_file():
+		try:
 			with open(str(toml_path), "r") as f:
-				while result == None:
-					string=f.readline()
+				for string in f: # stops at the end of file, if there is no version
 					if 'version = ' in string:
-						result = string.split('"')[1]
-		return result
+						return string.split('"')[1]
+		except FileNotFoundError: # installed package has no pyproject.toml
+			pass
+		return None
 	
 
 